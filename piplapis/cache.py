@@ -0,0 +1,68 @@
+"""An in-process cache for API responses.
+
+SearchAPIRequest uses it to serve identical searches from memory when a cache
+TTL is configured (see SearchAPIRequest.set_default_settings).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache(object):
+    """A thread-safe LRU cache whose entries expire after a TTL (in seconds).
+
+    Expiry is measured with time.monotonic(), so it's not affected by changes to
+    the system clock. There's no cleanup thread - an expired entry is removed
+    when it's looked up, or evicted as the least recently used one, so the cache
+    never holds more than `max_size` entries.
+    """
+
+    DEFAULT_MAX_SIZE = 1000
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param max_size: int, the maximum number of entries kept in the cache.
+                         When full, the least recently used entry is evicted.
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        """Return the value cached under `key`, or None if it's missing or expired.
+        :param key: hashable, the cache key.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """Cache `value` under `key` for `ttl` seconds.
+        :param key: hashable, the cache key.
+        :param value: the object to cache.
+        :param ttl: number, the time to live of the entry in seconds.
+        """
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            entries = self._entries
+            if key in entries:
+                entries.move_to_end(key)
+            elif entries and len(entries) >= self.max_size:
+                entries.popitem(last=False)
+            entries[key] = (value, expires_at)
+
+    def clear(self):
+        """Remove all the entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
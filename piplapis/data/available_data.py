@@ -10,9 +10,9 @@ class AvailableData(Serializable):
 
     def to_dict(self):
         d = {}
-        if self.basic is not None and type(self.basic) == FieldCount:
+        if isinstance(self.basic, FieldCount):
             d["basic"] = self.basic.to_dict()
-        if self.premium is not None and type(self.premium) == FieldCount:
+        if isinstance(self.premium, FieldCount):
             d["premium"] = self.premium.to_dict()
         return d
 
@@ -138,6 +138,7 @@ class FieldCount(Serializable):
     def from_dict(cls, d):
         kwargs = {}
         for key, value in d.items():
-            if key in cls.children and type(value) == int:
+            # An exact type check, since bool is a subclass of int
+            if key in cls.children and type(value) is int:
                 kwargs[key] = value
         return cls(**kwargs)
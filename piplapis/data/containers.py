@@ -1,5 +1,3 @@
-import itertools
-
 from piplapis.data.fields import *
 from piplapis.data.utils import *
 
@@ -11,6 +9,27 @@ class FieldsContainer(object):
     Do not use this class directly.
     """
 
+    __slots__ = (
+        "names",
+        "addresses",
+        "phones",
+        "emails",
+        "jobs",
+        "educations",
+        "images",
+        "usernames",
+        "user_ids",
+        "languages",
+        "ethnicities",
+        "origin_countries",
+        "urls",
+        "relationships",
+        "tags",
+        "dob",
+        "gender",
+        "vehicles",
+    )
+
     class_container = NotImplemented  # Implement in subclass
     singular_fields = NotImplemented  # Implement in subclass
 
@@ -68,6 +87,15 @@ class FieldsContainer(object):
         ]
         return multiple + single
 
+    @property
+    def fields_by_type(self):
+        """A dict with all the fields contained in this object, grouped by their
+        class (e.g. fields_by_type[Email] is a list of the emails)."""
+        fields_by_type = {}
+        for field in self.all_fields:
+            fields_by_type.setdefault(field.__class__, []).append(field)
+        return fields_by_type
+
     @classmethod
     def fields_from_dict(cls, d):
         """Load the fields from the dict, return a list with all the fields.
@@ -100,6 +128,8 @@ class FieldsContainer(object):
 class Relationship(Serializable, FieldsContainer):
     """Another person related to this person."""
 
+    __slots__ = ("type", "subtype", "valid_since", "inferred")
+
     class_container = {
         Name: "names",
         Address: "addresses",
@@ -184,7 +214,7 @@ class Relationship(Serializable, FieldsContainer):
         return d
 
     def __str__(self):
-        return str(self.names[0]) if self.names and len(self.names) > 0 else ""
+        return str(self.names[0]) if self.names else ""
 
 
 class Source(Serializable, FieldsContainer):
@@ -212,6 +242,19 @@ class Source(Serializable, FieldsContainer):
 
     """
 
+    __slots__ = (
+        "match",
+        "valid_since",
+        "name",
+        "category",
+        "origin_url",
+        "domain",
+        "sponsored",
+        "source_id",
+        "person_id",
+        "premium",
+    )
+
     class_container = {
         Name: "names",
         Address: "addresses",
@@ -375,6 +418,8 @@ class Person(Serializable, FieldsContainer):
 
     """
 
+    __slots__ = ("person_id", "search_pointer", "match", "inferred")
+
     class_container = {
         Name: "names",
         Address: "addresses",
@@ -412,19 +457,50 @@ class Person(Serializable, FieldsContainer):
     def is_searchable(self):
         """A bool value that indicates whether the person has enough data and
         can be sent as a query to the API."""
-        filter_func = lambda field: field.is_searchable
-        return bool(
-            self.search_pointer
-            or list(filter(filter_func, self.names))
-            or list(filter(filter_func, self.urls))
-            or list(filter(lambda x: x.is_sole_searchable, self.addresses))
-            or list(filter(filter_func, self.user_ids))
-            or list(filter(filter_func, self.emails))
-            or list(filter(filter_func, self.phones))
-            or list(filter(filter_func, self.usernames))
-            or list(filter(filter_func, self.vehicles))
+        if self.search_pointer:
+            return True
+        addresses = self.addresses
+        # Stops at the first searchable field. An address is searched by only
+        # when it's specific enough.
+        return any(
+            field.is_sole_searchable if fields is addresses else field.is_searchable
+            for fields in self._search_fields()
+            for field in fields
+        )
+
+    def _search_fields(self):
+        # The field lists a person can be searched by
+        return (
+            self.names,
+            self.emails,
+            self.phones,
+            self.usernames,
+            self.user_ids,
+            self.urls,
+            self.addresses,
+            self.vehicles,
         )
 
+    def search_state(self):
+        """Return a tuple of (is_searchable, unsearchable_fields), computed in a
+        single walk over the person's fields. See is_searchable and
+        unsearchable_fields."""
+        is_searchable = bool(self.search_pointer)
+        unsearchable_fields = []
+        addresses = self.addresses
+        for fields in self._search_fields():
+            for field in fields:
+                searchable = field.is_searchable
+                if not searchable:
+                    unsearchable_fields.append(field)
+                if fields is addresses:
+                    # An address is searched by only when it's specific enough
+                    searchable = field.is_sole_searchable
+                is_searchable = is_searchable or searchable
+        if self.dob and not self.dob.is_searchable:
+            unsearchable_fields.append(self.dob)
+        return bool(is_searchable), unsearchable_fields
+
     @property
     def unsearchable_fields(self):
         """A list of all the fields that can't be searched by.
@@ -433,20 +509,7 @@ class Person(Serializable, FieldsContainer):
         invalid etc.
 
         """
-        filter_func = lambda field: not field.is_searchable
-        return list(
-            itertools.chain(
-                filter(filter_func, self.names),
-                filter(filter_func, self.emails),
-                filter(filter_func, self.phones),
-                filter(filter_func, self.usernames),
-                filter(filter_func, self.user_ids),
-                filter(filter_func, self.urls),
-                filter(filter_func, self.addresses),
-                filter(filter_func, self.vehicles),
-                filter(filter_func, [x for x in [self.dob] if x]),
-            )
-        )
+        return self.search_state()[1]
 
     @classmethod
     def from_dict(cls, d):
@@ -1,15 +1,7 @@
 import logging
 from piplapis.data.utils import *
 
-try:
-    import urlparse
-    from urllib import urlencode
-except ImportError:
-    from urllib.parse import urlparse
-    from urllib.parse import urlencode
-    from builtins import int
-
-from six import u
+from urllib.parse import urlencode
 
 __all__ = [
     "Name",
@@ -35,10 +27,11 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-@six.python_2_unicode_compatible
 class Field(Serializable):
     """Base class of all data fields, made only for inheritance."""
 
+    __slots__ = ("valid_since", "inferred", "last_seen", "current")
+
     attributes = ()
     base_attributes = ("valid_since", "inferred", "last_seen", "current")
     children = ("content",)
@@ -66,14 +59,22 @@ class Field(Serializable):
         self.last_seen = last_seen
         self.current = current
 
-    def __setattr__(self, attr, value):
-        """Extend the default object.__setattr___ and make sure that str values
-        are converted to unicode and that assigning to the `type` attribute is
-        only from the allowed values.
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__setattr__" in cls.__dict__:  # The subclass defines its own
+            return
+        # Only fields with a type need the validating __setattr__, the others
+        # (which have no `type` slot to assign to) set attributes directly.
+        # Either way it's set explicitly, so that a subclass adding a type to its
+        # parent's attributes doesn't inherit object.__setattr__
+        if "type" in cls.attributes:
+            cls.__setattr__ = Field.__setattr__
+        else:
+            cls.__setattr__ = object.__setattr__
 
-        Setting an str value for an attribute is impossible, if an str is
-        provided then it must be in utf8 encoding and it will be automatically
-        converted to a unicode object.
+    def __setattr__(self, attr, value):
+        """Extend the default object.__setattr___ and make sure that assigning
+        to the `type` attribute is only from the allowed values.
 
         Example:
         >>> from piplapis.data import Name
@@ -82,11 +83,6 @@ class Field(Serializable):
         'clark'
 
         """
-        if six.PY2 and isinstance(value, str):
-            try:
-                value = value.decode("utf8")
-            except UnicodeDecodeError:
-                raise ValueError("Tried to assign a non utf8 string to " + attr)
         if attr == "type":
             try:
                 self.validate_type(value)
@@ -175,6 +171,8 @@ class Field(Serializable):
 
 
 class Gender(Field):
+    __slots__ = ("_content",)
+
     children = ("content",)
 
     genders = set(["male", "female"])
@@ -217,6 +215,8 @@ class Ethnicity(Field):
         'chamorro', 'samoan', 'other_pacific_islander', 'other'.
     """
 
+    __slots__ = ("content",)
+
     children = ("content",)
 
     def __init__(self, content=None, *args, **kwargs):
@@ -239,6 +239,10 @@ class Ethnicity(Field):
 class Name(Field):
     """A name of a person."""
 
+    __slots__ = (
+        "prefix", "first", "middle", "last", "suffix", "raw", "type", "_display"
+    )
+
     attributes = ("type",)
     children = ("prefix", "first", "middle", "last", "suffix", "raw", "display")
     types_set = set(["present", "maiden", "former", "alias", "alternative", "autogenerated"])
@@ -283,15 +287,29 @@ class Name(Field):
     def is_searchable(self):
         """A bool value that indicates whether the name is a valid name to
         search by."""
-        first = alpha_chars(self.first or u(""))
-        last = alpha_chars(self.last or u(""))
-        raw = alpha_chars(self.raw or u(""))
-        return len(first) >= 1 or len(last) >= 1 or len(raw) >= 1
+        first = alpha_chars(self.first or "")
+        last = alpha_chars(self.last or "")
+        raw = alpha_chars(self.raw or "")
+        return bool(first or last or raw)
 
 
 class Address(Field):
     """An address of a person."""
 
+    __slots__ = (
+        "country",
+        "state",
+        "city",
+        "zip_code",
+        "po_box",
+        "street",
+        "house",
+        "apartment",
+        "raw",
+        "type",
+        "_display",
+    )
+
     attributes = ("type",)
     children = (
         "country",
@@ -414,6 +432,18 @@ class Address(Field):
 class Phone(Field):
     """A phone number of a person."""
 
+    __slots__ = (
+        "country_code",
+        "number",
+        "raw",
+        "extension",
+        "type",
+        "_display",
+        "display_international",
+        "do_not_call",
+        "voip",
+    )
+
     attributes = ("type", "do_not_call", "voip")
     children = (
         "country_code",
@@ -477,6 +507,8 @@ class Email(Field):
 
     """
 
+    __slots__ = ("address", "address_md5", "type", "email_provider", "disposable")
+
     attributes = ("type", "disposable", "email_provider")
     children = ("address", "address_md5")
     types_set = set(["personal", "work"])
@@ -566,6 +598,8 @@ class Vehicle(Field):
     Vehicle information.
     """
 
+    __slots__ = ("vin", "year", "make", "model", "color", "vehicle_type")
+
     children = ("vin", "year", "make", "model", "color", "vehicle_type")
 
     def __init__(
@@ -649,6 +683,8 @@ class Vehicle(Field):
 class Job(Field):
     """Job information of a person."""
 
+    __slots__ = ("title", "organization", "industry", "date_range", "_display")
+
     children = ("title", "organization", "industry", "date_range", "display")
 
     def __init__(
@@ -679,6 +715,8 @@ class Job(Field):
 class Education(Field):
     """Education information of a person."""
 
+    __slots__ = ("degree", "school", "date_range", "_display")
+
     children = ("degree", "school", "date_range", "display")
 
     def __init__(self, degree=None, school=None, date_range=None, display=None, *args, **kwargs):
@@ -699,6 +737,8 @@ class Education(Field):
 class Image(Field):
     """A URL of an image of a person."""
 
+    __slots__ = ("url", "thumbnail_token")
+
     children = ("url", "thumbnail_token")
 
     def __init__(self, url=None, thumbnail_token=None, *args, **kwargs):
@@ -767,7 +807,7 @@ class Image(Field):
             raise ValueError("Please provide at least one image.")
 
         images_with_tokens = [x for x in (first_image, second_image) if x and x.thumbnail_token]
-        if len(images_with_tokens) == 0:
+        if not images_with_tokens:
             raise ValueError("You can only generate thumbnail URLs for image objects with a thumbnail token.")
 
         if len(images_with_tokens) == 1:
@@ -792,6 +832,8 @@ class Image(Field):
 class OriginCountry(Field):
     """An origin country of the person."""
 
+    __slots__ = ("country",)
+
     children = ("country",)
 
     def __init__(self, country=None, *args, **kwargs):
@@ -812,6 +854,8 @@ class OriginCountry(Field):
 class Language(Field):
     """A language the person is familiar with."""
 
+    __slots__ = ("language", "region", "_display")
+
     children = ("language", "region", "display")
 
     def __init__(self, language=None, region=None, display=None, *args, **kwargs):
@@ -834,6 +878,8 @@ class Username(Field):
 
     """
 
+    __slots__ = ("content",)
+
     def __init__(self, content=None, *args, **kwargs):
         """`content` is the username itself, it should be a unicode object or
         a utf8 encoded str (will be decoded automatically).
@@ -850,7 +896,7 @@ class Username(Field):
     def is_searchable(self):
         """A bool value that indicates whether the username is a valid username
         to search by."""
-        return len(alnum_chars(self.content or u(""))) >= 3
+        return len(alnum_chars(self.content or "")) >= 3
 
 
 class UserID(Field):
@@ -861,6 +907,8 @@ class UserID(Field):
 
     """
 
+    __slots__ = ("content",)
+
     def __init__(self, content=None, *args, **kwargs):
         """`content` is the ID itself, it should be a unicode object or a utf8
         encoded str (will be decoded automatically).
@@ -890,6 +938,8 @@ class DOB(Field):
 
     """
 
+    __slots__ = ("date_range", "_display")
+
     children = ("date_range", "display")
 
     def __init__(self, date_range=None, display=None, *args, **kwargs):
@@ -1005,6 +1055,8 @@ class URL(Field):
     about the person, or a URL otherwise related to the person.
     """
 
+    __slots__ = ("url", "domain", "sponsored", "name", "category", "source_id")
+
     attributes = ("category", "sponsored", "domain", "name", "source_id")
     children = ("url",)
     categories_set = set(
@@ -1076,6 +1128,8 @@ class Tag(Field):
 
     """
 
+    __slots__ = ("content", "classification")
+
     attributes = ("classification",)
 
     def __init__(self, content=None, classification=None, *args, **kwargs):
@@ -1100,6 +1154,8 @@ class DateRange(Serializable):
 
     """
 
+    __slots__ = ("start", "end")
+
     def __init__(self, start, end):
         """`start` and `end` are datetime.date objects, both are required.
 
@@ -1,11 +1,20 @@
 # coding=utf-8
-from __future__ import unicode_literals
 import re
 import json
 import datetime
 
-import six
-from six import PY2
+# orjson is an optional, much faster JSON codec; fall back to the json module
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode("utf8")
+
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
 
 STATES = {
     "US": {
@@ -375,19 +384,21 @@ class Serializable(object):
     an object.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_json(cls, json_str):
         """
         Deserialize the object from a JSON string.
-        :param json_str: str or unicode. The JSON string to deserialize.
+        :param json_str: str, unicode or bytes. The JSON string to deserialize.
         """
-        d = json.loads(json_str)
+        d = json_loads(json_str)
         return cls.from_dict(d)
 
     def to_json(self):
         """Serialize the object to a JSON string."""
         d = self.to_dict()
-        return json.dumps(d)
+        return json_dumps(d)
 
     def to_dict(self):
         raise NotImplementedError
@@ -452,10 +463,8 @@ def to_utf8(obj):
     :param obj: The object to represent in utf8.
     """
 
-    if isinstance(obj, six.text_type):
+    if isinstance(obj, str):
         return obj.encode("utf8")
-    elif PY2:
-        return str(obj)
     else:
         bytes(obj)
 
@@ -466,9 +475,7 @@ def to_unicode(obj):
     :param obj: The object to decode to unicode.
 
     """
-    if isinstance(obj, six.binary_type):
+    if isinstance(obj, bytes):
         return obj.decode("utf8")
-    elif PY2:
-        return six.u(obj)
     else:
         return str(obj)
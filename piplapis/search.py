@@ -13,36 +13,123 @@ The classes are based on the person data-model that's implemented here in the
 sub-package piplapis.data.
 
 """
-import json
-
+import asyncio
 import datetime
+import hashlib
 import logging
+import operator
 import os
 
 import pytz as pytz
 
-from six import string_types
-
-try:
-    import urllib.request as urllib2
-    from urllib.parse import urlencode
-except ImportError:
-    import urllib2
-    from urllib import urlencode
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote_plus, urlencode
 
-import urllib
-import itertools
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 import piplapis
+from piplapis.cache import ResponseCache
 from piplapis.data.available_data import AvailableData
 from piplapis.error import APIError
 from piplapis.data import *
-from piplapis.data.utils import Serializable
+from piplapis.data.utils import Serializable, json_loads
 
 logger = logging.getLogger(__name__)
 
 
+def _create_session(retries):
+    """Create the pooled HTTP session used to talk to the API.
+    :param retries: int, how many times to retry a request that couldn't connect
+                    or that the API was unavailable for (503).
+    """
+    session = requests.Session()
+    max_retries = Retry(
+        total=retries,
+        connect=retries,
+        # A search that may have reached the API is never resent, it's charged
+        # against the quota even if the response was lost. Read errors are
+        # raised as is (e.g. requests.ReadTimeout), and so are the gateway
+        # errors (502, 504) since the search may have run behind the gateway.
+        read=False,
+        status=retries,
+        backoff_factor=0.2,
+        status_forcelist=(503,),
+        allowed_methods=frozenset(["POST"]),
+        # Return the last response when retries run out, so send() reports it
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=10, pool_maxsize=50, max_retries=max_retries
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# The validators of the optional request params. None is valid for all of them,
+# top_match and the probabilities are only checked when they're set to a true value.
+def _is_bool(value):
+    return value is None or type(value) is bool
+
+
+def _is_true_bool(value):
+    return not value or type(value) is bool
+
+
+def _is_string(value):
+    return value is None or isinstance(value, str)
+
+
+def _is_probability(value):
+    return not value or (type(value) is float and not (value > 1 or value < 0))
+
+
+# Checked with `in` (i.e. ==), so 1 and 0 are accepted as True and False
+_SHOW_SOURCES_VALUES = ("all", "matching", "false", "true", True, False, None)
+
+
+def _is_show_sources_value(value):
+    return value in _SHOW_SOURCES_VALUES
+
+
+# (attribute, validator, error message) for the strict validation of the optional
+# request params, in the order they're checked.
+_PARAM_VALIDATORS = (
+    ("top_match", _is_true_bool, "top_match should be a boolean"),
+    (
+        "minimum_match",
+        _is_probability,
+        "minimum_match should be a float between 0 and 1",
+    ),
+    ("hide_sponsored", _is_bool, "hide_sponsored should be a boolean"),
+    ("infer_persons", _is_bool, "infer_persons should be a boolean"),
+    ("live_feeds", _is_bool, "live_feeds should be a boolean"),
+    (
+        "match_requirements",
+        _is_string,
+        "match_requirements should be an str or unicode object",
+    ),
+    (
+        "source_category_requirements",
+        _is_string,
+        "source_category_requirements should be an str or unicode object",
+    ),
+    (
+        "show_sources",
+        _is_show_sources_value,
+        'show_sources has a wrong value. Should be "matching", "all", True, False or None',
+    ),
+    (
+        "minimum_probability",
+        _is_probability,
+        "minimum_probability should be a float between 0 and 1",
+    ),
+)
+
+
 class SearchAPIRequest(object):
     """A request to Pipl's Search API.
 
@@ -88,13 +175,69 @@ class SearchAPIRequest(object):
     that may be the person you're looking for)
     live_feeds - boolean (default True), whether to use live data feeds. Can be turned off
     for performance.
+
+    Responses can also be cached in-process, so that sending an identical request
+    again within `cache_ttl` seconds returns the cached response without calling
+    the API (see set_default_settings). Requests that use live feeds (the default)
+    aren't cached.
+
+    The query (including the JSON serialization of the person) is computed once
+    and reused by url, send() and get_search_query(). Setting any of the request's
+    attributes resets it, but modifying request.person in place after the query was
+    computed does not - re-assign it (request.person = person) in that case.
     """
 
-    HEADERS = {"User-Agent": "piplapis/python/%s" % piplapis.__version__}
+    __slots__ = (
+        "api_key",
+        "person",
+        "minimum_probability",
+        "minimum_match",
+        "top_match",
+        "hide_sponsored",
+        "infer_persons",
+        "live_feeds",
+        "show_sources",
+        "match_requirements",
+        "source_category_requirements",
+        "use_https",
+        "response_class",
+        "api_version",
+        "cache_ttl",
+        "base_url",
+        "_person_json",
+        "_search_query",
+        "_encoded_query",
+        "_base_url",
+    )
+
+    HEADERS = {
+        "User-Agent": "piplapis/python/%s" % piplapis.__version__,
+        "Content-Type": "application/x-www-form-urlencoded",
+        # Responses with many sources compress well, requests decodes them
+        "Accept-Encoding": "gzip, deflate",
+    }
     DEFAULT_API_VERSION = 5
     DEFAULT_BASE_URL = "https://api.pipl.com/search/"
+    DEFAULT_ASYNC_WORKERS = 32
+    DEFAULT_RETRIES = 3
+    # Seconds to wait for a connection and for the response, searches that use
+    # live feeds can take a while
+    DEFAULT_TIMEOUT = (10, 60)
     BASE_URL = os.environ.get("PIPL_SEARCH_API_URL", DEFAULT_BASE_URL)
 
+    # The optional query params, sent when they're not None (in this order)
+    _OPTIONAL_PARAMS = (
+        "minimum_probability",
+        "minimum_match",
+        "top_match",
+        "hide_sponsored",
+        "infer_persons",
+        "match_requirements",
+        "source_category_requirements",
+        "live_feeds",
+        "show_sources",
+    )
+
     # The following are default settings for all request objects
     # You can set them once instead of passing them to the constructor every time
     default_api_key = None
@@ -109,6 +252,26 @@ class SearchAPIRequest(object):
     default_match_requirements = None
     default_source_category_requirements = None
     default_response_class = None
+    default_cache_ttl = None
+    default_async_workers = DEFAULT_ASYNC_WORKERS
+    default_retries = DEFAULT_RETRIES
+    default_timeout = DEFAULT_TIMEOUT
+
+    # Responses cached by send() when a cache_ttl is set, shared by all requests
+    _response_cache = ResponseCache()
+    # Futures of the cacheable requests currently being sent, by cache key
+    _inflight = {}
+    _inflight_lock = threading.Lock()
+    # The worker threads of send_async, created on first use
+    _executor = None
+    _executor_lock = threading.Lock()
+    # All requests share one HTTP session (created on first use), so keep-alive
+    # connections to the API are reused instead of doing a new TCP/TLS handshake
+    # per search
+    _session = None
+    # Whether _session was created by the library (and so is closed by it)
+    _session_created = False
+    _session_lock = threading.Lock()
 
     @classmethod
     def set_default_settings(
@@ -126,6 +289,12 @@ class SearchAPIRequest(object):
         top_match=None,
         response_class=None,
         api_version=None,
+        cache_ttl=None,
+        cache_max_size=None,
+        async_workers=None,
+        retries=None,
+        session=None,
+        timeout=None,
     ):
         cls.default_api_key = api_key
         cls.default_minimum_probability = minimum_probability
@@ -140,6 +309,59 @@ class SearchAPIRequest(object):
         cls.default_infer_persons = infer_persons
         cls.default_response_class = response_class
         cls.default_api_version = api_version or SearchAPIRequest.DEFAULT_API_VERSION
+        cls.default_cache_ttl = cache_ttl
+        cls.default_timeout = timeout if timeout is not None else cls.DEFAULT_TIMEOUT
+        cls._response_cache = ResponseCache(
+            cache_max_size or ResponseCache.DEFAULT_MAX_SIZE
+        )
+        cls.set_async_workers(async_workers or cls.DEFAULT_ASYNC_WORKERS)
+        with cls._session_lock:
+            cls.default_retries = (
+                retries if retries is not None else cls.DEFAULT_RETRIES
+            )
+            # Unless a session is given, the next request creates one with the
+            # new settings
+            cls._replace_session(session)
+
+    @classmethod
+    def set_session(cls, session):
+        """Set the HTTP session that sends the requests, without changing the
+        other default settings.
+
+        :param session: requests.Session, or None for a pooled session that's
+                        created (on the next request) with the default settings.
+                        A given session isn't closed by the library.
+        """
+        with cls._session_lock:
+            cls._replace_session(session)
+
+    @classmethod
+    def _replace_session(cls, session):
+        # Called with _session_lock held. The pooled connections of a session
+        # the library created are closed, requests still using it complete.
+        if cls._session_created:
+            cls._session.close()
+        cls._session = session
+        cls._session_created = False
+
+    @classmethod
+    def clear_cache(cls):
+        """Remove all the responses from the in-process response cache."""
+        cls._response_cache.clear()
+
+    @classmethod
+    def set_async_workers(cls, async_workers):
+        """Set the number of threads that send requests for send_async/send_aio,
+        without changing the other default settings.
+        Requests already submitted to the current threads still complete.
+
+        :param async_workers: int, the maximum number of requests sent at once.
+        """
+        with cls._executor_lock:
+            cls.default_async_workers = async_workers
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False)
+            cls._executor = None
 
     def __init__(
         self,
@@ -179,6 +401,8 @@ class SearchAPIRequest(object):
         top_match=None,
         response_class=None,
         api_version=None,
+        cache_ttl=None,
+        base_url=None,
     ):
         """Initiate a new request object with given query params.
 
@@ -241,86 +465,145 @@ class SearchAPIRequest(object):
         :param response_class: object, an object inheriting SearchAPIResponse and adding functionality beyond the basic
                             response scope. This provides the option to override methods or just add them.
         :param api_version: number, the API version to use. Defaults to 5.
+        :param cache_ttl: number, the number of seconds a response to this request is kept in the
+                          in-process response cache. Identical requests sent within that time, or
+                          while this one is still in flight, get the same response object (shared,
+                          so don't modify it). Only requests with live_feeds=False (given or
+                          by default) are cached, since the API uses live feeds unless they're
+                          turned off. Defaults to no caching.
+        :param base_url: str, the search endpoint URL to send this request to.
+                         Defaults to SearchAPIRequest.BASE_URL.
 
         Each of the arguments that should have a unicode value accepts both
         unicode objects and utf8 encoded str (will be decoded automatically).
         """
-        if person is None:
-            person = Person()
+        # Nothing is memoized yet, so the attributes are set without going
+        # through __setattr__
+        init = object.__setattr__
+        init(self, "_person_json", None)
+        init(self, "_search_query", None)
+        init(self, "_encoded_query", None)
+        init(self, "_base_url", None)
+
+        # Collect the fields from the params and add them to the person at once
+        fields = []
         if first_name or middle_name or last_name:
-            name = Name(first=first_name, middle=middle_name, last=last_name)
-            person.add_fields([name])
+            fields.append(Name(first=first_name, middle=middle_name, last=last_name))
         if raw_name:
-            person.add_fields([Name(raw=raw_name)])
+            fields.append(Name(raw=raw_name))
         if email:
-            person.add_fields([Email(address=email)])
+            fields.append(Email(address=email))
         if phone or raw_phone:
-            person.add_fields(
-                [Phone(country_code=country_code, number=phone, raw=raw_phone)]
-            )
+            fields.append(Phone(country_code=country_code, number=phone, raw=raw_phone))
         if username:
-            person.add_fields([Username(content=username)])
+            fields.append(Username(content=username))
         if url:
-            person.add_fields([URL(url=url)])
+            fields.append(URL(url=url))
         if user_id:
-            person.add_fields([UserID(content=user_id)])
+            fields.append(UserID(content=user_id))
         if country or state or city or house or street or zip_code:
-            address = Address(
-                country=country,
-                state=state,
-                city=city,
-                house=house,
-                street=street,
-                zip_code=zip_code,
+            fields.append(
+                Address(
+                    country=country,
+                    state=state,
+                    city=city,
+                    house=house,
+                    street=street,
+                    zip_code=zip_code,
+                )
             )
-            person.add_fields([address])
         if raw_address:
-            person.add_fields([Address(raw=raw_address)])
+            fields.append(Address(raw=raw_address))
         if vin:
-            person.add_fields([Vehicle(vin=vin)])
+            fields.append(Vehicle(vin=vin))
         if from_age is not None or to_age is not None:
-            dob = DOB.from_age_range(from_age or 0, to_age or 1000)
-            person.add_fields([dob])
+            fields.append(DOB.from_age_range(from_age or 0, to_age or 1000))
 
+        if person is None:
+            person = Person()
+        if fields:
+            person.add_fields(fields)
         person.search_pointer = search_pointer
-        self.person = person
+        init(self, "person", person)
 
-        self.api_key = api_key or self.default_api_key
-        self.show_sources = (
-            show_sources if show_sources is not None else self.default_show_sources
+        init(self, "api_key", api_key or self.default_api_key)
+        init(
+            self,
+            "show_sources",
+            show_sources if show_sources is not None else self.default_show_sources,
         )
-        self.live_feeds = (
-            live_feeds if live_feeds is not None else self.default_live_feeds
+        init(
+            self,
+            "live_feeds",
+            live_feeds if live_feeds is not None else self.default_live_feeds,
         )
-        self.minimum_match = minimum_match or self.default_minimum_match
-        self.top_match = top_match or self.default_top_match
-        self.minimum_probability = (
-            minimum_probability or self.default_minimum_probability
+        init(self, "minimum_match", minimum_match or self.default_minimum_match)
+        init(self, "top_match", top_match or self.default_top_match)
+        init(
+            self,
+            "minimum_probability",
+            minimum_probability or self.default_minimum_probability,
         )
-        self.hide_sponsored = (
+        init(
+            self,
+            "hide_sponsored",
             hide_sponsored
             if hide_sponsored is not None
-            else self.default_hide_sponsored
+            else self.default_hide_sponsored,
+        )
+        init(
+            self,
+            "match_requirements",
+            match_requirements or self.default_match_requirements,
         )
-        self.match_requirements = match_requirements or self.default_match_requirements
-        self.source_category_requirements = (
-            source_category_requirements or self.default_source_category_requirements
+        init(
+            self,
+            "source_category_requirements",
+            source_category_requirements or self.default_source_category_requirements,
         )
-        self.use_https = use_https if use_https is not None else self.default_use_https
-        self.infer_persons = (
-            infer_persons if infer_persons is not None else self.default_infer_persons
+        init(
+            self,
+            "use_https",
+            use_https if use_https is not None else self.default_use_https,
         )
-        self.api_version = self._normalize_api_version(
-            api_version or self.DEFAULT_API_VERSION
+        init(
+            self,
+            "infer_persons",
+            infer_persons if infer_persons is not None else self.default_infer_persons,
+        )
+        init(
+            self,
+            "api_version",
+            self._normalize_api_version(api_version or self.DEFAULT_API_VERSION),
         )
 
+        init(
+            self,
+            "cache_ttl",
+            cache_ttl if cache_ttl is not None else self.default_cache_ttl,
+        )
+        init(self, "base_url", base_url)
+
         response_class = response_class or self.default_response_class
-        self.response_class = (
+        init(
+            self,
+            "response_class",
             response_class
             if response_class and issubclass(response_class, SearchAPIResponse)
-            else SearchAPIResponse
+            else SearchAPIResponse,
         )
 
+    def __setattr__(self, name, value):
+        # Changing any query parameter invalidates the memoized query
+        if not name.startswith("_"):
+            object.__setattr__(self, "_search_query", None)
+            object.__setattr__(self, "_encoded_query", None)
+            if name == "person":
+                object.__setattr__(self, "_person_json", None)
+            elif name in ("api_version", "base_url"):
+                object.__setattr__(self, "_base_url", None)
+        object.__setattr__(self, name, value)
+
     def validate_query_params(self, strict=True):
         """Check if the request is valid and can be sent, raise ValueError if
         not.
@@ -332,61 +615,20 @@ class SearchAPIRequest(object):
         """
         if not self.api_key:
             raise ValueError("API key is missing")
+        # Only an unsearchable person needs all its fields checked
+        is_searchable = self.person.is_searchable
         if strict:
-            if self.top_match and type(self.top_match) is not bool:
-                raise ValueError("top_match should be a boolean")
-            if self.minimum_match and (
-                type(self.minimum_match) is not float
-                or self.minimum_match > 1
-                or self.minimum_match < 0
-            ):
-                raise ValueError("minimum_match should be a float between 0 and 1")
-            if (
-                self.hide_sponsored is not None
-                and type(self.hide_sponsored) is not bool
-            ):
-                raise ValueError("hide_sponsored should be a boolean")
-            if self.infer_persons is not None and type(self.infer_persons) is not bool:
-                raise ValueError("infer_persons should be a boolean")
-            if self.live_feeds is not None and type(self.live_feeds) is not bool:
-                raise ValueError("live_feeds should be a boolean")
-            if self.match_requirements is not None and not isinstance(
-                self.match_requirements, string_types
-            ):
-                raise ValueError(
-                    "match_requirements should be an str or unicode object"
-                )
-            if self.source_category_requirements is not None and not isinstance(
-                self.source_category_requirements, string_types
-            ):
-                raise ValueError(
-                    "source_category_requirements should be an str or unicode object"
-                )
-            if self.show_sources not in (
-                "all",
-                "matching",
-                "false",
-                "true",
-                True,
-                False,
-                None,
-            ):
-                raise ValueError(
-                    'show_sources has a wrong value. Should be "matching", "all", True, False or None'
-                )
-            if self.minimum_probability and (
-                type(self.minimum_probability) is not float
-                or self.minimum_probability > 1
-                or self.minimum_probability < 0
-            ):
-                raise ValueError(
-                    "minimum_probability should be a float between 0 and 1"
-                )
-            if self.person.unsearchable_fields and not self.person.is_searchable:
+            for attr, validator, error in _PARAM_VALIDATORS:
+                if not validator(getattr(self, attr)):
+                    raise ValueError(error)
+            unsearchable_fields = (
+                self.person.unsearchable_fields if not is_searchable else None
+            )
+            if unsearchable_fields:
                 raise ValueError(
-                    "Some fields are unsearchable: %s" % self.person.unsearchable_fields
+                    "Some fields are unsearchable: %s" % unsearchable_fields
                 )
-        if not self.person.is_searchable:
+        if not is_searchable:
             raise ValueError(
                 "No valid name/username/user_id/phone/email/address/vin or search pointer in request"
             )
@@ -394,34 +636,49 @@ class SearchAPIRequest(object):
     @property
     def url(self):
         """The URL of the request (str)."""
-        query = self.get_search_query()
-        return self.get_base_url() + urlencode(query, doseq=True)
+        return self.get_base_url() + self._get_encoded_query()
 
     def get_search_query(self):
-        query = {"key": self.api_key}
-        if self.person and self.person.search_pointer:
-            query["search_pointer"] = self.person.search_pointer
-        elif self.person:
-            query["person"] = self.person.to_json()
-        if self.minimum_probability is not None:
-            query["minimum_probability"] = self.minimum_probability
-        if self.minimum_match is not None:
-            query["minimum_match"] = self.minimum_match
-        if self.top_match is not None:
-            query["top_match"] = self.top_match
-        if self.hide_sponsored is not None:
-            query["hide_sponsored"] = self.hide_sponsored
-        if self.infer_persons is not None:
-            query["infer_persons"] = self.infer_persons
-        if self.match_requirements is not None:
-            query["match_requirements"] = self.match_requirements
-        if self.source_category_requirements is not None:
-            query["source_category_requirements"] = self.source_category_requirements
-        if self.live_feeds is not None:
-            query["live_feeds"] = self.live_feeds
-        if self.show_sources is not None:
-            query["show_sources"] = self.show_sources
-        return query
+        """The query params of the request (dict).
+        The dict is memoized on the request, don't modify it."""
+        if self._search_query is None:
+            self._search_query = dict(self._build_query_pairs())
+        return self._search_query
+
+    def _get_encoded_query(self):
+        # The form-encoded query, shared by the URL and the POST body
+        if self._encoded_query is None:
+            person = self.person
+            search_pointer = person.search_pointer if person else None
+            if search_pointer and all(
+                getattr(self, name) is None for name in self._OPTIONAL_PARAMS
+            ):
+                # Fast path for the common drill-down request, which has nothing
+                # but the key and a search pointer
+                self._encoded_query = "key=%s&search_pointer=%s" % (
+                    quote_plus(str(self.api_key)),
+                    quote_plus(search_pointer),
+                )
+            else:
+                # The values are all scalars, so no need for doseq
+                self._encoded_query = urlencode(self._build_query_pairs())
+        return self._encoded_query
+
+    def _build_query_pairs(self):
+        # The query params as a list of (name, value) pairs
+        pairs = [("key", self.api_key)]
+        person = self.person
+        if person and person.search_pointer:
+            pairs.append(("search_pointer", person.search_pointer))
+        elif person:
+            if self._person_json is None:
+                self._person_json = person.to_json()
+            pairs.append(("person", self._person_json))
+        for name in self._OPTIONAL_PARAMS:
+            value = getattr(self, name)
+            if value is not None:
+                pairs.append((name, value))
+        return pairs
 
     def send(self, strict_validation=True):
         """Send the request and return the response or raise SearchAPIError.
@@ -435,8 +692,8 @@ class SearchAPIRequest(object):
         :param strict_validation:  bool. Used by self.validate_query_params.
 
         :raises ValueError (raised from validate_query_params),
-        httpError/URLError and SearchAPIError (when the response is returned
-        but contains an error).
+        requests.RequestException (e.g. HTTPError/ConnectionError) and
+        SearchAPIError (when the response is returned but contains an error).
 
         example:
         >>> from piplapis.search import SearchAPIRequest, SearchAPIError
@@ -451,32 +708,69 @@ class SearchAPIRequest(object):
         """
         self.validate_query_params(strict=strict_validation)
 
-        query = self.get_search_query()
-        request = urllib2.Request(
-            url=self.get_base_url(),
-            data=urlencode(query, True).encode(),
-            headers=SearchAPIRequest.HEADERS,
-        )
+        if not self._is_cacheable():
+            return self._send_request()
+
+        cache_key = self._get_cache_key()
+        search_response = self._response_cache.get(cache_key)
+        if search_response is not None:
+            return search_response
+
+        # Identical requests sent concurrently share a single API call
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[cache_key] = Future()
+        if not is_owner:
+            return future.result()
         try:
-            response = urllib2.urlopen(request)
-            json_response = response.read().decode()
-            search_response = self.response_class.from_json(json_response)
-            search_response._add_rate_limiting_headers(
-                *self._get_quota_and_throttle_data(response.headers)
-            )
+            search_response = self._send_request()
+            self._response_cache.set(cache_key, search_response, self.cache_ttl)
+            future.set_result(search_response)
             return search_response
-        except urllib2.HTTPError as e:
-            json_error = e.read()
-            if not json_error:
-                raise e
+        except BaseException as e:
+            # Even e.g. a KeyboardInterrupt is passed on, so the identical
+            # requests waiting for this one don't block forever
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    def _send_request(self):
+        response = self._get_session().post(
+            self.get_base_url(),
+            data=self._get_encoded_query(),
+            headers=SearchAPIRequest.HEADERS,
+            timeout=self.default_timeout,
+        )
+        if response.status_code >= 400:
+            if not response.content:
+                response.raise_for_status()
             try:
-                exception = SearchAPIError.from_json(json_error.decode())
-                exception._add_rate_limiting_headers(
-                    *self._get_quota_and_throttle_data(e.headers)
-                )
-                raise exception
+                exception = SearchAPIError.from_json(response.content)
             except ValueError:
-                raise e
+                response.raise_for_status()
+            exception._add_rate_limiting_headers(
+                *self._get_quota_and_throttle_data(response.headers)
+            )
+            raise exception
+        search_response = self.response_class.from_json(response.content)
+        search_response._add_rate_limiting_headers(
+            *self._get_quota_and_throttle_data(response.headers)
+        )
+        return search_response
+
+    def _is_cacheable(self):
+        # Live feeds data isn't cached, and the API uses live feeds unless the
+        # request turned them off (the default setting is applied by __init__)
+        return bool(self.cache_ttl) and self.live_feeds is False
+
+    def _get_cache_key(self):
+        # The response class is part of the key since the cache holds parsed responses
+        digest = hashlib.blake2b(self.url.encode()).hexdigest()
+        return self.response_class, digest
 
     @staticmethod
     def _get_quota_and_throttle_data(headers):
@@ -571,9 +865,12 @@ class SearchAPIRequest(object):
 
         use this method if you want to send the request asynchronously so your
         program can do other things while waiting for the response.
+        The requests are sent by a pool of `default_async_workers` threads
+        (see set_default_settings).
 
         :param strict_validation: bool. Used by self.validate_query_params.
         :param callback: Callable with the following signature - callback(response=None, error=None).
+        :return: A concurrent.futures.Future of the response.
 
         example:
 
@@ -587,20 +884,167 @@ class SearchAPIRequest(object):
         >>> do_other_things()
         """
 
-        def target():
-            try:
-                response = self.send(strict_validation)
-                callback(response=response)
-            except Exception as e:
-                callback(error=e)
+        def done(future):
+            error = future.exception()
+            if error is None:
+                callback(response=future.result())
+            else:
+                callback(error=error)
+
+        future = self._submit(self.send, strict_validation)
+        future.add_done_callback(done)
+        return future
+
+    async def send_aio(self, strict_validation=True):
+        """Same as send() but awaitable, for use from asyncio code.
+
+        The request is sent by the send_async thread pool over the shared
+        session, so the event loop isn't blocked while waiting for the response.
+
+        :param strict_validation: bool. Used by self.validate_query_params.
+
+        example:
+
+        >>> from piplapis.search import SearchAPIRequest
+        >>>
+        >>> async def search(emails):
+        ...     requests = [SearchAPIRequest('YOURKEY', email=email) for email in emails]
+        ...     return await asyncio.gather(*(request.send_aio() for request in requests))
+        """
+        future = self._submit(self.send, strict_validation)
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    def _get_session(cls):
+        session = cls._session
+        if session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = _create_session(cls.default_retries)
+                    cls._session_created = True
+                session = cls._session
+        return session
+
+    @classmethod
+    def _submit(cls, fn, *args):
+        # Submitted under the lock, so set_async_workers can't shut the
+        # executor down in between
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls.default_async_workers
+                )
+            return cls._executor.submit(fn, *args)
+
+    @classmethod
+    def send_many(
+        cls, search_requests, max_concurrency=16, strict_validation=True, ordered=False
+    ):
+        """Send many requests concurrently and iterate over their responses.
+
+        At most `max_concurrency` requests are sent at the same time, all of
+        them over the shared connection pool.
+
+        :param search_requests: An iterable of SearchAPIRequest objects.
+        :param max_concurrency: int, the maximum number of requests sent at once.
+        :param strict_validation: bool. Used by validate_query_params.
+        :param ordered: bool. If True, the results are returned in the order the
+                        requests were given in, otherwise in the order they complete.
+        :return: An iterator of (request, response) tuples. When sending a request
+                 fails, the exception (e.g. a SearchAPIError) is returned instead
+                 of the response.
 
-        threading.Thread(target=target).start()
+        example:
+
+        >>> from piplapis.search import SearchAPIRequest
+        >>> requests = [SearchAPIRequest('YOURKEY', email=email) for email in emails]
+        >>> for request, response in SearchAPIRequest.send_many(requests):
+        ...     if isinstance(response, Exception):
+        ...         handle_error(request, response)
+        """
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        futures = {}
+        try:
+            for search_request in search_requests:
+                future = executor.submit(search_request.send, strict_validation)
+                futures[future] = search_request
+            for future in futures if ordered else as_completed(futures):
+                error = future.exception()
+                yield futures[future], future.result() if error is None else error
+        finally:
+            # Don't send the remaining requests if the iteration was stopped
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def _normalize_api_version(self, api_version):
         return str(api_version).rstrip(".0")
 
     def get_base_url(self):
-        return f"{self.BASE_URL}v{self.api_version}/?"
+        # Built once per request, BASE_URL is read the first time it's needed
+        if self._base_url is None:
+            base_url = self.base_url or self.BASE_URL
+            self._base_url = f"{base_url}v{self.api_version}/?"
+        return self._base_url
+
+
+# The grouping keys of SearchAPIResponse.group_sources_by_*
+def _source_domain(source):
+    return source.domain or ""
+
+
+def _source_category(source):
+    return source.category or ""
+
+
+def _source_match(source):
+    return source.match or 0
+
+
+class _person_attr(object):
+    """A read-only shortcut of SearchAPIResponse to one of its person's
+    attributes (None when there's no person), e.g. `gender = _person_attr("gender")`.
+
+    The value is computed once, like functools.cached_property, but since
+    responses have __slots__ it's kept in the response's _shortcuts dict, which
+    is reset whenever the response's person is replaced.
+    """
+
+    def __init__(self, attr, doc=None):
+        self.get_attr = operator.attrgetter(attr)
+        self.name = None
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, response, owner=None):
+        if response is None:
+            return self
+        shortcuts = response._shortcuts
+        try:
+            return shortcuts[self.name]
+        except KeyError:
+            value = shortcuts[self.name] = self.compute(response)
+            return value
+
+    def compute(self, response):
+        # Read the slot directly rather than going through the person property
+        try:
+            return self.get_attr(response._person)
+        except AttributeError:
+            return None
+
+
+class _first_of(_person_attr):
+    """A shortcut to the first item of one of the person's lists (None when
+    there's no person or the list is empty), e.g. `name = _first_of("names")`."""
+
+    def compute(self, response):
+        try:
+            return self.get_attr(response._person)[0]
+        except (AttributeError, IndexError):
+            return None
 
 
 class SearchAPIResponse(Serializable):
@@ -647,8 +1091,48 @@ class SearchAPIResponse(Serializable):
     were invalid you can see in response.query that they were ignored, you can
     also see how the name/address from your query were parsed in case you
     passed raw_name/raw_address in the query.
+
+    The shortcuts to the person's data (response.name, response.email etc.) are
+    computed once per response. Setting response.person resets them, but modifying
+    the person in place after a shortcut was read does not.
     """
 
+    __slots__ = (
+        "query",
+        "_person",
+        "_shortcuts",
+        "warnings",
+        "http_status_code",
+        "visible_sources",
+        "available_sources",
+        "search_id",
+        "available_data",
+        "match_requirements",
+        "source_category_requirements",
+        "persons_count",
+        "_raw_json",
+        "_sources",
+        "_raw_sources",
+        "_possible_persons",
+        "_raw_possible_persons",
+        "_grouped_sources",
+        "qps_allotted",
+        "qps_current",
+        "qps_live_allotted",
+        "qps_live_current",
+        "qps_demo_allotted",
+        "qps_demo_current",
+        "quota_allotted",
+        "quota_current",
+        "quota_reset",
+        "demo_usage_allotted",
+        "demo_usage_current",
+        "demo_usage_expiry",
+        "package_allotted",
+        "package_current",
+        "package_expiry",
+    )
+
     def __init__(
         self,
         query=None,
@@ -686,6 +1170,7 @@ class SearchAPIResponse(Serializable):
          :param persons_count: int. The number of persons in this response.
         """
         self.query = query
+        self._shortcuts = {}
         self.person = person
         self.sources = sources or []
         self.possible_persons = possible_persons or []
@@ -702,7 +1187,7 @@ class SearchAPIResponse(Serializable):
             self.persons_count = (
                 1 if self.person is not None else len(self.possible_persons)
             )
-        self.raw_json = None
+        self._raw_json = None
 
         # Rate limiting data
         self.qps_allotted = None  # Your permitted queries per second
@@ -723,6 +1208,55 @@ class SearchAPIResponse(Serializable):
         self.package_current = None  # The number of used matches.
         self.package_expiry = None  # The date and time when the key and the remaining matches will expire.
 
+    @property
+    def person(self):
+        """A Person object with data about the person in the query."""
+        return self._person
+
+    @person.setter
+    def person(self, person):
+        self._person = person
+        # The shortcuts (name, email etc.) are taken from the person
+        self._shortcuts = {}
+
+    @property
+    def sources(self):
+        """A list of Source objects, parsed on first access."""
+        sources = self._sources
+        if sources is None:
+            raw_sources = self._raw_sources
+            if raw_sources is None:  # Parsed meanwhile by another thread
+                return self._sources
+            sources = self._sources = list(map(Source.from_dict, raw_sources))
+            self._raw_sources = None
+        return sources
+
+    @sources.setter
+    def sources(self, sources):
+        self._sources = sources
+        self._raw_sources = None
+        # The groupings are computed from the sources
+        self._grouped_sources = {}
+
+    @property
+    def possible_persons(self):
+        """A list of Person objects, parsed on first access."""
+        possible_persons = self._possible_persons
+        if possible_persons is None:
+            raw_possible_persons = self._raw_possible_persons
+            if raw_possible_persons is None:  # Parsed meanwhile by another thread
+                return self._possible_persons
+            possible_persons = self._possible_persons = list(
+                map(Person.from_dict, raw_possible_persons)
+            )
+            self._raw_possible_persons = None
+        return possible_persons
+
+    @possible_persons.setter
+    def possible_persons(self, possible_persons):
+        self._possible_persons = possible_persons
+        self._raw_possible_persons = None
+
     @property
     def matching_sources(self):
         """Sources that match the person from the query.
@@ -733,6 +1267,15 @@ class SearchAPIResponse(Serializable):
         """
         return [source for source in self.sources if source.match == 1.0]
 
+    @property
+    def non_matching_sources(self):
+        """Sources that hold data about someone other than the person of the
+        response (their person_id isn't the person's), e.g. the sources of the
+        possible persons when show_sources is "all".
+        """
+        person_id = self.person.person_id if self.person is not None else None
+        return [source for source in self.sources if source.person_id != person_id]
+
     def group_sources(self, key_function):
         """Return a dict with the sources grouped by the key returned by
         `key_function`.
@@ -741,55 +1284,80 @@ class SearchAPIResponse(Serializable):
         group by (see examples in the group_sources_by_* methods below).
 
         :return dict, a key in this dict is a key returned by
-        `key_function` and the value is a list of all the sources with this key.
+        `key_function` and the value is a list of all the sources with this key,
+        in their original order.
         """
-        sorted_sources = sorted(self.sources, key=key_function)
-        grouped_sources = itertools.groupby(sorted_sources, key=key_function)
-        return dict([(key, list(group)) for key, group in grouped_sources])
+        grouped_sources = {}
+        for source in self.sources:
+            grouped_sources.setdefault(key_function(source), []).append(source)
+        return grouped_sources
+
+    def _group_sources_once(self, grouping, key_function):
+        # Each grouping is computed once, until the sources are replaced
+        grouped_sources = self._grouped_sources.get(grouping)
+        if grouped_sources is None:
+            grouped_sources = self.group_sources(key_function)
+            self._grouped_sources[grouping] = grouped_sources
+        return grouped_sources
 
     def group_sources_by_domain(self):
         """Return the sources grouped by the domain they came from.
+        The result is computed once per response, don't modify it.
 
         :return dict, a key in this dict is a domain
         and the value is a list of all the sources with this domain.
 
         """
-        key_function = lambda source: source.domain or ""
-        return self.group_sources(key_function)
+        return self._group_sources_once("domain", _source_domain)
 
     def group_sources_by_category(self):
         """Return the sources grouped by their category.
+        The result is computed once per response, don't modify it.
 
         :return dict, a key in this dict is a category
         and the value is a list of all the sources with this category.
 
         """
-        key_function = lambda source: source.category or ""
-        return self.group_sources(key_function)
+        return self._group_sources_once("category", _source_category)
 
     def group_sources_by_match(self):
         """Return the sources grouped by their match attribute.
+        The result is computed once per response, don't modify it.
 
         :return dict, a key in this dict is a match
         float and the value is a list of all the sources with this
         match value.
 
         """
-        key_function = lambda source: source.match or 0
-        return self.group_sources(key_function)
+        return self._group_sources_once("match", _source_match)
 
     @classmethod
     def from_json(cls, json_str):
         """
-        We override this method in SearchAPIResponse so that
-        :param json_str:
+        We override this method in SearchAPIResponse so that the raw JSON is
+        kept on the response (see raw_json).
+        :param json_str: str or bytes. The JSON to deserialize.
         :return:
         """
-        d = json.loads(json_str)
+        d = json_loads(json_str)
         obj = cls.from_dict(d)
-        obj.raw_json = json_str
+        obj._raw_json = json_str
         return obj
 
+    @property
+    def raw_json(self):
+        """The JSON string the response was parsed from (or None).
+        Responses are parsed from the bytes of the HTTP body, which are only
+        decoded to a string on first access."""
+        raw_json = self._raw_json
+        if isinstance(raw_json, bytes):
+            raw_json = self._raw_json = raw_json.decode("utf8")
+        return raw_json
+
+    @raw_json.setter
+    def raw_json(self, raw_json):
+        self._raw_json = raw_json
+
     @classmethod
     def from_dict(cls, d):
         """Transform the dict to a response object and return the response.
@@ -816,15 +1384,16 @@ class SearchAPIResponse(Serializable):
         person = d.get("person") or None
         if person is not None:
             person = Person.from_dict(person)
-        sources = d.get("sources")
-        if sources:
-            sources = [Source.from_dict(source) for source in sources]
-        possible_persons = [Person.from_dict(x) for x in d.get("possible_persons", [])]
-        return cls(
+
+        # Sources and possible persons are only parsed when first accessed
+        raw_sources = d.get("sources") or []
+        raw_possible_persons = d.get("possible_persons") or []
+        if not persons_count:
+            persons_count = 1 if person is not None else len(raw_possible_persons)
+
+        response = cls(
             query=query,
             person=person,
-            sources=sources,
-            possible_persons=possible_persons,
             warnings_=warnings_,
             http_status_code=http_status_code,
             visible_sources=visible_sources,
@@ -835,6 +1404,11 @@ class SearchAPIResponse(Serializable):
             source_category_requirements=source_category_requirements,
             persons_count=persons_count,
         )
+        response._sources = None
+        response._raw_sources = raw_sources
+        response._possible_persons = None
+        response._raw_possible_persons = raw_possible_persons
+        return response
 
     def to_dict(self):
         """Return a dict representation of the response."""
@@ -859,6 +1433,8 @@ class SearchAPIResponse(Serializable):
             d["query"] = self.query.to_dict()
         if self.person is not None:
             d["person"] = self.person.to_dict()
+        # Sources and possible persons are parsed (if they weren't yet) so they're
+        # always serialized the same way
         if self.sources:
             d["sources"] = [source.to_dict() for source in self.sources]
         if self.possible_persons:
@@ -867,183 +1443,29 @@ class SearchAPIResponse(Serializable):
             ]
         return d
 
-    @property
-    def gender(self):
-        """
-        A shortcut method to get the result's person's gender.
-        return Gender
-        """
-        return self.person.gender if self.person else None
-
-    @property
-    def dob(self):
-        """
-        A shortcut method to get the result's person's age.
-        return DOB
-        """
-        return self.person.dob if self.person else None
-
-    @property
-    def job(self):
-        """
-        A shortcut method to get the result's person's job.
-        return Job
-        """
-        return (
-            self.person.jobs[0] if self.person and len(self.person.jobs) > 0 else None
-        )
-
-    @property
-    def address(self):
-        """
-        A shortcut method to get the result's person's address.
-        return Address
-        """
-        return (
-            self.person.addresses[0]
-            if self.person and len(self.person.addresses) > 0
-            else None
-        )
-
-    @property
-    def education(self):
-        """
-        A shortcut method to get the result's person's education.
-        return Education
-        """
-        return (
-            self.person.educations[0]
-            if self.person and len(self.person.educations) > 0
-            else None
-        )
-
-    @property
-    def language(self):
-        """
-        A shortcut method to get the result's person's spoken language.
-        return Language
-        """
-        return (
-            self.person.languages[0]
-            if self.person and len(self.person.languages) > 0
-            else None
-        )
-
-    @property
-    def ethnicity(self):
-        """
-        A shortcut method to get the result's person's ethnicity.
-        return Ethnicity
-        """
-        return (
-            self.person.ethnicities[0]
-            if self.person and len(self.person.ethnicities) > 0
-            else None
-        )
-
-    @property
-    def origin_country(self):
-        """
-        A shortcut method to get the result's person's origin country.
-        return OriginCountry
-        """
-        return (
-            self.person.origin_countries[0]
-            if self.person and len(self.person.origin_countries) > 0
-            else None
-        )
-
-    @property
-    def phone(self):
-        """
-        A shortcut method to get the result's person's phone.
-        return Phone
-        """
-        return (
-            self.person.phones[0]
-            if self.person and len(self.person.phones) > 0
-            else None
-        )
-
-    @property
-    def email(self):
-        """
-        A shortcut method to get the result's person's email.
-        return Email
-        """
-        return (
-            self.person.emails[0]
-            if self.person and len(self.person.emails) > 0
-            else None
-        )
-
-    @property
-    def name(self):
-        """
-        A shortcut method to get the result's person's name.
-        return Name
-        """
-        return (
-            self.person.names[0] if self.person and len(self.person.names) > 0 else None
-        )
-
-    @property
-    def image(self):
-        """
-        A shortcut method to get the result's person's image.
-        return Image
-        """
-        return (
-            self.person.images[0]
-            if self.person and len(self.person.images) > 0
-            else None
-        )
-
-    @property
-    def url(self):
-        """
-        A shortcut method to get the result's person's url.
-        return URL
-        """
-        return (
-            self.person.urls[0] if self.person and len(self.person.urls) > 0 else None
-        )
-
-    @property
-    def username(self):
-        """
-        A shortcut method to get the result's person's username.
-        return Username
-        """
-        return (
-            self.person.usernames[0]
-            if self.person and len(self.person.usernames) > 0
-            else None
-        )
-
-    @property
-    def user_id(self):
-        """
-        A shortcut method to get the result's person's user_id.
-        return UserID
-        """
-        return (
-            self.person.user_ids[0]
-            if self.person and len(self.person.user_ids) > 0
-            else None
-        )
-
-    @property
-    def relationship(self):
-        """
-        A shortcut method to get the result's person's most prominent relationship.
-        return Relationship
-        """
-        return (
-            self.person.relationships[0]
-            if self.person and len(self.person.relationships) > 0
-            else None
-        )
+    # Shortcuts to the result's person's data
+    gender = _person_attr("gender", "The result's person's gender (Gender).")
+    dob = _person_attr("dob", "The result's person's age (DOB).")
+    job = _first_of("jobs", "The result's person's job (Job).")
+    address = _first_of("addresses", "The result's person's address (Address).")
+    education = _first_of("educations", "The result's person's education (Education).")
+    language = _first_of(
+        "languages", "The result's person's spoken language (Language)."
+    )
+    ethnicity = _first_of("ethnicities", "The result's person's ethnicity (Ethnicity).")
+    origin_country = _first_of(
+        "origin_countries", "The result's person's origin country (OriginCountry)."
+    )
+    phone = _first_of("phones", "The result's person's phone (Phone).")
+    email = _first_of("emails", "The result's person's email (Email).")
+    name = _first_of("names", "The result's person's name (Name).")
+    image = _first_of("images", "The result's person's image (Image).")
+    url = _first_of("urls", "The result's person's url (URL).")
+    username = _first_of("usernames", "The result's person's username (Username).")
+    user_id = _first_of("user_ids", "The result's person's user_id (UserID).")
+    relationship = _first_of(
+        "relationships", "The result's person's most prominent relationship (Relationship)."
+    )
 
     def add_quota_throttle_data(self, *args, **kwargs):
         logger.warn("SearchAPIResponse.add_quota_throttle_data is deprecated")
@@ -1,5 +1,5 @@
-import logging
 import os
+import warnings
 from piplapis.data import (
     Person,
     Email,
@@ -18,6 +18,9 @@ from piplapis.data import (
 from piplapis.data.containers import Relationship
 from piplapis.search import SearchAPIRequest, SearchAPIResponse
 from unittest import TestCase
+from unittest.mock import patch
+
+import requests
 
 
 # Tests for the pipl API using the python client library
@@ -25,20 +28,134 @@ from unittest import TestCase
 # TESTING_KEY: the API key to use
 # API_TESTS_BASE_URL: the base URL on which to execute requests
 
-handler = logging.StreamHandler()
-logging.getLogger("piplapis").addHandler(handler)
-logger = logging.getLogger("piplapis")
-logger.warning(
-    "The api_tests module API in piplapis.tests is deprecated & does not receive updates."
+warnings.warn(
+    "The api_tests module API in piplapis.tests is deprecated & does not receive updates.",
+    DeprecationWarning,
+    stacklevel=2,
+)
+
+# The field types (besides masked emails) available to each developer class
+_CONTACT_TYPES = frozenset(
+    (Name, Gender, DOB, URL, Language, OriginCountry, Address, Phone)
+)
+_SOCIAL_TYPES = frozenset(
+    (
+        Name,
+        Gender,
+        DOB,
+        Language,
+        OriginCountry,
+        Address,
+        Phone,
+        Username,
+        UserID,
+        Image,
+        Relationship,
+        URL,
+    )
 )
 
 
 class APITests(TestCase):
-    def setUp(self):
-        SearchAPIRequest.default_api_key = os.getenv("TESTING_KEY")
-        SearchAPIRequest.BASE_URL = (
-            os.getenv("API_TESTS_BASE_URL") + "?developer_class=business_premium"
+    # The requests of the tests that only check a response (by name). They're
+    # independent, so they're all sent concurrently before the tests run.
+    PREFETCHED_REQUESTS = {
+        "broad": dict(first_name="brian", last_name="perks"),
+        "narrow": dict(email="brianperks@gmail.com"),
+        "hide_sponsored": dict(email="brianperks@gmail.com", hide_sponsored=True),
+        "hide_inferred": dict(email="brianperks@gmail.com", minimum_probability=1.0),
+        "inferred": dict(email="brianperks@gmail.com", minimum_probability=0.5),
+        "matching_sources": dict(email="brianperks@gmail.com", show_sources="matching"),
+        "all_sources": dict(email="brianperks@gmail.com", show_sources="all"),
+        "minimum_match": dict(first_name="brian", last_name="perks", minimum_match=0.7),
+        "clark_kent": dict(email="clark.kent@example.com"),
+        "md5": dict(
+            person=Person(
+                fields=[Email(address_md5="e34996fda036d60aa2a595ca86ed8fef")]
+            )
+        ),
+    }
+
+    # The number of fields of each type the narrow search is expected to have,
+    # by the available_data section (premium or basic) they're counted in
+    EXPECTED_FIELD_COUNTS = {
+        "premium": dict(
+            relationships=8,
+            usernames=2,
+            jobs=13,
+            addresses=9,
+            phones=4,
+            emails=4,
+            languages=1,
+            names=1,
+            dobs=1,
+            images=2,
+            genders=1,
+            educations=2,
+            social_profiles=3,
+        ),
+        "basic": dict(
+            relationships=7,
+            usernames=2,
+            jobs=12,
+            addresses=6,
+            phones=1,
+            emails=3,
+            user_ids=4,
+            languages=1,
+            names=1,
+            dobs=1,
+            images=2,
+            genders=1,
+            educations=2,
+            social_profiles=3,
+        ),
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        base_url = os.environ["API_TESTS_BASE_URL"]
+        cls._URL_PREMIUM = base_url + "?developer_class=business_premium"
+        cls._URL_CONTACT = base_url + "?developer_class=contact"
+        cls._URL_SOCIAL = base_url + "?developer_class=social"
+        cls._API_KEY = os.environ["TESTING_KEY"]
+        # The class-wide settings are restored when the tests are done
+        cls._settings_patcher = patch.multiple(
+            SearchAPIRequest, BASE_URL=cls._URL_PREMIUM, default_api_key=cls._API_KEY
         )
+        cls._settings_patcher.start()
+        # All the tests' requests go through one keep-alive session
+        cls._session = requests.Session()
+        SearchAPIRequest.set_session(cls._session)
+        # The narrow search is also checked as the other developer classes
+        requests_kwargs = dict(
+            cls.PREFETCHED_REQUESTS,
+            contact_narrow=dict(
+                email="brianperks@gmail.com", base_url=cls._URL_CONTACT
+            ),
+            social_narrow=dict(email="brianperks@gmail.com", base_url=cls._URL_SOCIAL),
+        )
+        prefetched = {
+            SearchAPIRequest(**kwargs): name for name, kwargs in requests_kwargs.items()
+        }
+        cls.responses = {
+            prefetched[request]: response
+            for request, response in SearchAPIRequest.send_many(prefetched)
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        SearchAPIRequest.set_session(None)
+        cls._session.close()
+        SearchAPIRequest.clear_cache()
+        cls._settings_patcher.stop()
+
+    def get_response(self, name):
+        """The response of one of the PREFETCHED_REQUESTS."""
+        response = self.responses[name]
+        if isinstance(response, Exception):
+            raise response
+        return response
 
     def get_broad_search_request(self):
         return SearchAPIRequest(first_name="brian", last_name="perks")
@@ -46,24 +163,17 @@ class APITests(TestCase):
     def get_narrow_search_request(self):
         return SearchAPIRequest(email="brianperks@gmail.com")
 
-    def get_narrow_md5_search_request(self):
-        return SearchAPIRequest(
-            person=Person(
-                fields=[Email(address_md5="e34996fda036d60aa2a595ca86ed8fef")]
-            )
-        )
-
     def test_basic_request(self):
-        response = self.get_broad_search_request().send()
-        self.assertEquals(response.http_status_code, 200)
+        response = self.get_response("broad")
+        self.assertEqual(response.http_status_code, 200)
 
     def test_search_makes_a_match_request(self):
-        response = self.get_narrow_search_request().send()
-        self.assertEquals(response.http_status_code, 200)
+        response = self.get_response("narrow")
+        self.assertEqual(response.http_status_code, 200)
         self.assertIsNotNone(response.person)
 
     def test_recursive_request(self):
-        response = self.get_broad_search_request().send()
+        response = self.get_response("broad")
         self.assertGreater(len(response.possible_persons), 0)
         second_response = SearchAPIRequest(
             search_pointer=response.possible_persons[0].search_pointer
@@ -71,125 +181,84 @@ class APITests(TestCase):
         self.assertIsNotNone(second_response.person)
 
     def test_make_sure_hide_sponsored_works(self):
-        request = self.get_narrow_search_request()
-        request.hide_sponsored = True
-        response = request.send()
+        response = self.get_response("hide_sponsored")
         sponsored_links = [x for x in response.person.urls if x.sponsored]
-        self.assertEquals(len(sponsored_links), 0)
+        self.assertEqual(len(sponsored_links), 0)
 
     def test_make_sure_we_can_hide_inferred(self):
-        request = self.get_narrow_search_request()
-        request.minimum_probability = 1.0
-        response = request.send()
+        response = self.get_response("hide_inferred")
         inferred_data = [x for x in response.person.all_fields if x.inferred]
-        self.assertEquals(len(inferred_data), 0)
+        self.assertEqual(len(inferred_data), 0)
 
     def test_make_sure_we_get_inferred(self):
-        request = self.get_narrow_search_request()
-        request.minimum_probability = 0.5
-        response = request.send()
+        response = self.get_response("inferred")
         inferred_data = [x for x in response.person.all_fields if x.inferred]
         self.assertGreater(len(inferred_data), 0)
 
     def test_make_sure_show_sources_matching_works(self):
-        request = self.get_narrow_search_request()
-        request.show_sources = "matching"
-        response = request.send()
+        response = self.get_response("matching_sources")
         self.assertGreater(len(response.sources), 0)
-        non_matching_sources = [
-            x for x in response.sources if x.person_id != response.person.person_id
-        ]
-        self.assertEquals(len(non_matching_sources), 0)
+        self.assertEqual(len(response.non_matching_sources), 0)
 
     def test_make_sure_show_sources_all_works(self):
-        request = self.get_narrow_search_request()
-        request.show_sources = "all"
-        response = request.send()
-        non_matching_sources = [
-            x for x in response.sources if x.person_id != response.person.person_id
-        ]
-        self.assertGreater(len(non_matching_sources), 0)
+        response = self.get_response("all_sources")
+        self.assertGreater(len(response.non_matching_sources), 0)
 
     def test_make_sure_minimum_match_works(self):
-        request = self.get_broad_search_request()
-        request.minimum_match = 0.7
-        response = request.send()
+        response = self.get_response("minimum_match")
         persons_below_match = [x for x in response.possible_persons if x.match < 0.7]
-        self.assertEquals(len(persons_below_match), 0)
+        self.assertEqual(len(persons_below_match), 0)
 
     def test_make_sure_deserialization_works(self):
-        response = SearchAPIRequest(email="clark.kent@example.com").send()
-        self.assertEquals(response.person.names[0].display, "Clark Joseph Kent")
-        self.assertEquals(
+        response = self.get_response("clark_kent")
+        self.assertEqual(response.person.names[0].display, "Clark Joseph Kent")
+        self.assertEqual(
             response.person.emails[1].address_md5, "999e509752141a0ee42ff455529c10fc"
         )
-        self.assertEquals(response.person.usernames[0].content, "superman@facebook")
-        self.assertEquals(
+        self.assertEqual(response.person.usernames[0].content, "superman@facebook")
+        self.assertEqual(
             response.person.addresses[1].display,
             "1000-355 Broadway, Metropolis, Kansas",
         )
-        self.assertEquals(
+        self.assertEqual(
             response.person.jobs[0].display,
             "Field Reporter at The Daily Planet (2000-2012)",
         )
-        self.assertEquals(response.person.educations[0].degree, "B.Sc Advanced Science")
+        self.assertEqual(response.person.educations[0].degree, "B.Sc Advanced Science")
+
+    def test_send_many_returns_a_response_per_request(self):
+        # The prefetched requests were sent with send_many
+        self.assertEqual(len(self.responses), len(self.PREFETCHED_REQUESTS) + 2)
+        for name, response in self.responses.items():
+            with self.subTest(name=name):
+                self.assertIsInstance(response, SearchAPIResponse)
 
     def test_make_sure_md5_search_works(self):
-        self.assertIsNotNone(self.get_narrow_md5_search_request().send().person)
+        self.assertIsNotNone(self.get_response("md5").person)
 
     def test_contact_datatypes_are_as_expected(self):
-        SearchAPIRequest.BASE_URL = (
-            os.getenv("API_TESTS_BASE_URL") + "?developer_class=contact"
-        )
-        response = self.get_narrow_search_request().send()
-        available_data_types = {
-            Name,
-            Gender,
-            DOB,
-            URL,
-            Language,
-            OriginCountry,
-            Address,
-            Phone,
-        }
-        for field in response.person.all_fields:
-            if type(field) == Email:
-                self.assertEqual(
-                    field.address, "full.email.available@business.subscription"
-                )
-            else:
-                self.assertIn(type(field), available_data_types)
+        response = self.get_response("contact_narrow")
+        fields_by_type = response.person.fields_by_type
+        for email in fields_by_type.pop(Email, []):
+            self.assertEqual(
+                email.address, "full.email.available@business.subscription"
+            )
+        self.assertLessEqual(set(fields_by_type), _CONTACT_TYPES)
 
     def test_social_datatypes_are_as_expected(self):
-        SearchAPIRequest.BASE_URL = (
-            os.getenv("API_TESTS_BASE_URL") + "?developer_class=social"
-        )
-        response = self.get_narrow_search_request().send()
-        available_data_types = {
-            Name,
-            Gender,
-            DOB,
-            Language,
-            OriginCountry,
-            Address,
-            Phone,
-            Username,
-            UserID,
-            Image,
-            Relationship,
-            URL,
-        }
-        for field in response.person.all_fields:
-            if type(field) == Email:
-                self.assertEqual(
-                    field.address, "full.email.available@business.subscription"
-                )
-            else:
-                self.assertIn(type(field), available_data_types)
+        response = self.get_response("social_narrow")
+        fields_by_type = response.person.fields_by_type
+        for email in fields_by_type.pop(Email, []):
+            self.assertEqual(
+                email.address, "full.email.available@business.subscription"
+            )
+        self.assertLessEqual(set(fields_by_type), _SOCIAL_TYPES)
 
     def test_forward_compatibility(self):
-        SearchAPIRequest.BASE_URL += "&show_unknown_fields=1"
-        request = SearchAPIRequest(email="clark.kent@example.com")
+        request = SearchAPIRequest(
+            email="clark.kent@example.com",
+            base_url=self._URL_PREMIUM + "&show_unknown_fields=1",
+        )
         response = request.send()
         self.assertIsNotNone(response.person)
 
@@ -203,44 +272,19 @@ class APITests(TestCase):
         self.assertTrue(failed)
 
     def test_make_sure_field_count_is_correct_on_premium(self):
-        res = self.get_narrow_search_request().send()
-        self.assertEqual(res.available_data.premium.relationships, 8)
-        self.assertEqual(res.available_data.premium.usernames, 2)
-        self.assertEqual(res.available_data.premium.jobs, 13)
-        self.assertEqual(res.available_data.premium.addresses, 9)
-        self.assertEqual(res.available_data.premium.phones, 4)
-        self.assertEqual(res.available_data.premium.emails, 4)
-        self.assertEqual(res.available_data.premium.languages, 1)
-        self.assertEqual(res.available_data.premium.names, 1)
-        self.assertEqual(res.available_data.premium.dobs, 1)
-        self.assertEqual(res.available_data.premium.images, 2)
-        self.assertEqual(res.available_data.premium.genders, 1)
-        self.assertEqual(res.available_data.premium.educations, 2)
-        self.assertEqual(res.available_data.premium.social_profiles, 3)
+        res = self.get_response("narrow")
+        for field, count in self.EXPECTED_FIELD_COUNTS["premium"].items():
+            with self.subTest(field=field):
+                self.assertEqual(getattr(res.available_data.premium, field), count)
 
     def test_make_sure_field_count_is_correct_on_basic(self):
-        SearchAPIRequest.BASE_URL = (
-            os.getenv("API_TESTS_BASE_URL") + "?developer_class=social"
-        )
-        res = self.get_narrow_search_request().send()
-        self.assertEqual(res.available_data.basic.relationships, 7)
-        self.assertEqual(res.available_data.basic.usernames, 2)
-        self.assertEqual(res.available_data.basic.jobs, 12)
-        self.assertEqual(res.available_data.basic.addresses, 6)
-        self.assertEqual(res.available_data.basic.phones, 1)
-        self.assertEqual(res.available_data.basic.emails, 3)
-        self.assertEqual(res.available_data.basic.user_ids, 4)
-        self.assertEqual(res.available_data.basic.languages, 1)
-        self.assertEqual(res.available_data.basic.names, 1)
-        self.assertEqual(res.available_data.basic.dobs, 1)
-        self.assertEqual(res.available_data.basic.images, 2)
-        self.assertEqual(res.available_data.basic.genders, 1)
-        self.assertEqual(res.available_data.basic.educations, 2)
-        self.assertEqual(res.available_data.basic.social_profiles, 3)
+        res = self.get_response("social_narrow")
+        for field, count in self.EXPECTED_FIELD_COUNTS["basic"].items():
+            with self.subTest(field=field):
+                self.assertEqual(getattr(res.available_data.basic, field), count)
 
     def test_response_class_default(self):
-        request = SearchAPIRequest(email="clark.kent@example.com")
-        response = request.send()
+        response = self.get_response("clark_kent")
         self.assertIsInstance(response, SearchAPIResponse)
 
     def test_response_class_custom(self):
@@ -0,0 +1,170 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from piplapis.cache import ResponseCache
+from piplapis.search import SearchAPIRequest, SearchAPIResponse
+
+
+class ResponseCacheTests(TestCase):
+    def test_get_returns_the_cached_value(self):
+        cache = ResponseCache()
+        cache.set("a", 1, 10)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1, 10)
+        cache.set("b", 2, 10)
+        cache.get("a")
+        cache.set("c", 3, 10)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_expired_entry_is_dropped(self):
+        cache = ResponseCache()
+        with patch("piplapis.cache.time.monotonic") as monotonic:
+            monotonic.return_value = 100
+            cache.set("a", 1, 10)
+            monotonic.return_value = 109.5
+            self.assertEqual(cache.get("a"), 1)
+            monotonic.return_value = 110
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.set("a", 1, 10)
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+
+
+class SearchAPIRequestCacheTests(TestCase):
+    def setUp(self):
+        SearchAPIRequest.clear_cache()
+        patcher = patch.object(
+            SearchAPIRequest,
+            "_send_request",
+            autospec=True,
+            side_effect=lambda request: SearchAPIResponse(),
+        )
+        self.send_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(SearchAPIRequest.clear_cache)
+
+    def make_request(self, **kwargs):
+        return SearchAPIRequest(
+            api_key="key", email="clark.kent@example.com", cache_ttl=60, **kwargs
+        )
+
+    def test_identical_requests_are_sent_once(self):
+        first = self.make_request(live_feeds=False).send()
+        second = self.make_request(live_feeds=False).send()
+        self.assertIs(first, second)
+        self.assertEqual(self.send_request.call_count, 1)
+
+    def test_different_requests_are_sent_separately(self):
+        self.make_request(live_feeds=False).send()
+        self.make_request(live_feeds=False, hide_sponsored=True).send()
+        self.assertEqual(self.send_request.call_count, 2)
+
+    def test_requests_with_live_feeds_are_not_cached(self):
+        self.make_request(live_feeds=True).send()
+        self.make_request(live_feeds=True).send()
+        self.assertEqual(self.send_request.call_count, 2)
+
+    def test_requests_without_live_feeds_setting_are_not_cached(self):
+        # The API uses live feeds unless they're turned off
+        self.make_request().send()
+        self.make_request().send()
+        self.assertEqual(self.send_request.call_count, 2)
+
+    def test_requests_are_cached_when_live_feeds_are_off_by_default(self):
+        with patch.object(SearchAPIRequest, "default_live_feeds", False):
+            first = self.make_request().send()
+            second = self.make_request().send()
+        self.assertIs(first, second)
+        self.assertEqual(self.send_request.call_count, 1)
+
+    def test_live_feeds_default_is_taken_when_the_request_is_built(self):
+        request = self.make_request()
+        with patch.object(SearchAPIRequest, "default_live_feeds", False):
+            request.send()
+            request.send()
+        self.assertNotIn("live_feeds", request.get_search_query())
+        self.assertEqual(self.send_request.call_count, 2)
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        started = threading.Event()
+        release = threading.Event()
+        response = SearchAPIResponse()
+
+        def send_request(request):
+            started.set()
+            release.wait(5)
+            return response
+
+        self.send_request.side_effect = send_request
+        responses = []
+        threads = [
+            threading.Thread(
+                target=lambda: responses.append(
+                    self.make_request(live_feeds=False).send()
+                )
+            )
+            for _ in range(4)
+        ]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(responses, [response] * 4)
+        self.assertEqual(self.send_request.call_count, 1)
+        self.assertEqual(SearchAPIRequest._inflight, {})
+
+    def test_failed_request_is_not_cached(self):
+        self.send_request.side_effect = requests.ConnectionError
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.make_request(live_feeds=False).send()
+        self.assertEqual(self.send_request.call_count, 2)
+        self.assertEqual(SearchAPIRequest._inflight, {})
+
+    def test_interrupted_request_releases_the_waiting_requests(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def send_request(request):
+            started.set()
+            release.wait(5)
+            raise KeyboardInterrupt
+
+        self.send_request.side_effect = send_request
+        errors = []
+
+        def send():
+            try:
+                self.make_request(live_feeds=False).send()
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=send, daemon=True) for _ in range(3)]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(isinstance(e, KeyboardInterrupt) for e in errors))
+        self.assertEqual(SearchAPIRequest._inflight, {})
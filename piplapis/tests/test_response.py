@@ -0,0 +1,158 @@
+from unittest import TestCase
+
+from piplapis.data import DOB, Address, Email, Gender, Name, Person, Phone
+from piplapis.search import SearchAPIResponse
+
+RESPONSE = {
+    "@http_status_code": 200,
+    "@visible_sources": 3,
+    "@available_sources": 3,
+    "@persons_count": 1,
+    "@search_id": "1",
+    "query": {"emails": [{"address": "clark.kent@example.com"}]},
+    "person": {
+        "@id": "11111111-1111-1111-1111-111111111111",
+        "@match": 1.0,
+        "names": [{"first": "Clark", "last": "Kent"}],
+        "emails": [
+            {"address": "clark.kent@example.com"},
+            {"address": "superman@example.com"},
+        ],
+        "phones": [{"country_code": 1, "number": 9785550145}],
+        "gender": {"content": "male"},
+    },
+    "sources": [
+        {
+            "@id": "a",
+            "@person_id": "11111111-1111-1111-1111-111111111111",
+            "@match": 1.0,
+            "@name": "Daily Planet",
+            "@domain": "dailyplanet.com",
+            "names": [{"first": "Clark", "last": "Kent"}],
+        },
+        {
+            "@id": "b",
+            "@person_id": "11111111-1111-1111-1111-111111111111",
+            "@match": 1.0,
+            "@name": "Smallville Gazette",
+            "@domain": "smallvillegazette.com",
+            "emails": [{"address": "superman@example.com"}],
+        },
+        {
+            "@id": "c",
+            "@person_id": "22222222-2222-2222-2222-222222222222",
+            "@match": 0.6,
+            "@name": "Metropolis Directory",
+            "@domain": "metropolis.com",
+            "names": [{"first": "Clark", "last": "Kent"}],
+            "phones": [{"country_code": 1, "number": 2125550123}],
+        },
+    ],
+}
+
+
+class FieldsByTypeTests(TestCase):
+    def setUp(self):
+        self.person = SearchAPIResponse.from_dict(RESPONSE).person
+
+    def test_fields_are_grouped_by_class(self):
+        fields_by_type = self.person.fields_by_type
+        self.assertEqual(set(fields_by_type), {Name, Email, Phone, Gender})
+        self.assertEqual(fields_by_type[Email], self.person.emails)
+        self.assertEqual(fields_by_type[Name], self.person.names)
+        self.assertEqual(fields_by_type[Gender], [self.person.gender])
+
+    def test_all_fields_are_included(self):
+        fields = [
+            field for fields in self.person.fields_by_type.values() for field in fields
+        ]
+        self.assertCountEqual(fields, self.person.all_fields)
+
+    def test_empty_container(self):
+        source = SearchAPIResponse.from_dict({"sources": [{"@id": "a"}]}).sources[0]
+        self.assertEqual(source.fields_by_type, {})
+
+
+class NonMatchingSourcesTests(TestCase):
+    def test_sources_of_other_persons(self):
+        response = SearchAPIResponse.from_dict(RESPONSE)
+        self.assertEqual(
+            [source.source_id for source in response.non_matching_sources], ["c"]
+        )
+        self.assertEqual(
+            [source.source_id for source in response.matching_sources], ["a", "b"]
+        )
+
+    def test_all_sources_without_a_person(self):
+        response = SearchAPIResponse.from_dict(dict(RESPONSE, person=None))
+        self.assertEqual(response.non_matching_sources, response.sources)
+
+    def test_no_sources(self):
+        response = SearchAPIResponse.from_dict(dict(RESPONSE, sources=[]))
+        self.assertEqual(response.non_matching_sources, [])
+
+
+class GroupSourcesTests(TestCase):
+    def test_grouping_is_computed_once(self):
+        response = SearchAPIResponse.from_dict(RESPONSE)
+        grouped_sources = response.group_sources_by_domain()
+        self.assertEqual(
+            list(grouped_sources),
+            ["dailyplanet.com", "smallvillegazette.com", "metropolis.com"],
+        )
+        self.assertIs(response.group_sources_by_domain(), grouped_sources)
+
+    def test_replacing_the_sources_resets_the_groupings(self):
+        response = SearchAPIResponse.from_dict(RESPONSE)
+        response.group_sources_by_domain()
+        response.group_sources_by_match()
+        response.sources = response.sources[:1]
+        self.assertEqual(list(response.group_sources_by_domain()), ["dailyplanet.com"])
+        self.assertEqual(list(response.group_sources_by_match()), [1.0])
+
+
+class ToDictTests(TestCase):
+    def test_output_does_not_depend_on_what_was_accessed(self):
+        d = dict(
+            RESPONSE,
+            possible_persons=[
+                {"@search_pointer": "abc", "emails": [{"address": "ck@example.com"}]}
+            ],
+        )
+        before = SearchAPIResponse.from_dict(d).to_dict()
+        response = SearchAPIResponse.from_dict(d)
+        response.sources
+        response.possible_persons
+        self.assertEqual(response.to_dict(), before)
+        self.assertEqual(
+            [source["@id"] for source in before["sources"]], ["a", "b", "c"]
+        )
+
+    def test_output_is_not_shared_with_the_response(self):
+        response = SearchAPIResponse.from_dict(RESPONSE)
+        response.to_dict()["sources"][0]["@name"] = "Changed"
+        self.assertEqual(response.sources[0].name, "Daily Planet")
+
+
+class SearchabilityTests(TestCase):
+    def test_is_searchable_agrees_with_search_state(self):
+        for fields in (
+            [],
+            [Email(address="clark.kent@example.com")],
+            [Email(address="bad"), Name(first="Clark", last="Kent")],
+            [Email(address="bad")],
+            [Address(country="US", city="Smallville")],
+            [Address(country="US", state="KS", city="Smallville", street="Main")],
+            [DOB.from_age_range(200, 300), Name(first="Clark")],
+        ):
+            with self.subTest(fields=fields):
+                person = Person(fields=fields)
+                is_searchable, unsearchable_fields = person.search_state()
+                self.assertEqual(person.is_searchable, is_searchable)
+                self.assertEqual(person.unsearchable_fields, unsearchable_fields)
+
+    def test_search_pointer_is_searchable(self):
+        person = Person(fields=[Email(address="bad")])
+        person.search_pointer = "abc"
+        self.assertTrue(person.is_searchable)
+        self.assertEqual(person.search_state(), (True, person.emails))
@@ -0,0 +1,243 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from piplapis.search import (
+    SearchAPIError,
+    SearchAPIRequest,
+    SearchAPIResponse,
+    _create_session,
+)
+
+
+class SendManyTests(TestCase):
+    def setUp(self):
+        patcher = patch.object(SearchAPIRequest, "send", autospec=True)
+        self.send = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.requests = [
+            SearchAPIRequest(api_key="key", email=f"clark.kent{i}@example.com")
+            for i in range(3)
+        ]
+
+    def test_results_are_ordered_by_completion(self):
+        release = threading.Event()
+        responses = {request: SearchAPIResponse() for request in self.requests}
+
+        def send(request, strict_validation=True):
+            # The first request completes last
+            if request is self.requests[0]:
+                release.wait(5)
+            return responses[request]
+
+        self.send.side_effect = send
+        results = []
+        for request, response in SearchAPIRequest.send_many(self.requests):
+            results.append((request, response))
+            if len(results) == 2:
+                release.set()
+        self.assertEqual(results[-1], (self.requests[0], responses[self.requests[0]]))
+        self.assertEqual(dict(results), responses)
+
+    def test_ordered_results_follow_the_input_order(self):
+        responses = {request: SearchAPIResponse() for request in self.requests}
+
+        def send(request, strict_validation=True):
+            # The first request completes last
+            if request is self.requests[0]:
+                time.sleep(0.1)
+            return responses[request]
+
+        self.send.side_effect = send
+        results = list(SearchAPIRequest.send_many(self.requests, ordered=True))
+        self.assertEqual(results, [(r, responses[r]) for r in self.requests])
+
+    def test_errors_are_returned_with_their_requests(self):
+        error = SearchAPIError("Bad request", 400)
+        response = SearchAPIResponse()
+
+        def send(request, strict_validation=True):
+            if request is self.requests[1]:
+                raise error
+            return response
+
+        self.send.side_effect = send
+        results = dict(SearchAPIRequest.send_many(self.requests))
+        self.assertIs(results[self.requests[1]], error)
+        self.assertIs(results[self.requests[0]], response)
+        self.assertIs(results[self.requests[2]], response)
+
+    def test_strict_validation_is_passed_to_send(self):
+        self.send.return_value = SearchAPIResponse()
+        list(SearchAPIRequest.send_many(self.requests[:1], strict_validation=False))
+        self.send.assert_called_once_with(self.requests[0], False)
+
+    def test_closing_the_iterator_cancels_the_pending_requests(self):
+        executors = []
+
+        def make_executor(*args, **kwargs):
+            executors.append(ThreadPoolExecutor(*args, **kwargs))
+            return executors[-1]
+
+        release = threading.Event()
+
+        def send(request, strict_validation=True):
+            if request is not self.requests[0]:
+                release.wait(5)
+            return SearchAPIResponse()
+
+        self.send.side_effect = send
+        with patch("piplapis.search.ThreadPoolExecutor", side_effect=make_executor):
+            results = SearchAPIRequest.send_many(self.requests, max_concurrency=1)
+            request, response = next(results)
+            results.close()
+        release.set()
+        executors[0].shutdown(wait=True)
+        self.assertIs(request, self.requests[0])
+        sent = [call.args[0] for call in self.send.call_args_list]
+        self.assertNotIn(self.requests[2], sent)
+
+
+class BaseURLTests(TestCase):
+    def test_default_base_url(self):
+        with patch.object(SearchAPIRequest, "BASE_URL", "https://example.com/search/"):
+            request = SearchAPIRequest(api_key="key", email="clark.kent@example.com")
+            self.assertTrue(request.url.startswith("https://example.com/search/v5/?"))
+
+    def test_request_base_url(self):
+        request = SearchAPIRequest(
+            api_key="key",
+            email="clark.kent@example.com",
+            base_url="https://example.com/search/",
+        )
+        self.assertEqual(request.get_base_url(), "https://example.com/search/v5/?")
+        request.base_url = "https://example.org/search/"
+        self.assertEqual(request.get_base_url(), "https://example.org/search/v5/?")
+        request.base_url = None
+        self.assertEqual(request.get_base_url(), SearchAPIRequest.BASE_URL + "v5/?")
+
+    def test_request_is_sent_to_the_base_url(self):
+        session = Mock()
+        session.post.return_value = Mock(
+            status_code=200, content=b'{"@http_status_code": 200}', headers={}
+        )
+        SearchAPIRequest.set_session(session)
+        self.addCleanup(SearchAPIRequest.set_session, None)
+        request = SearchAPIRequest(
+            api_key="key",
+            email="clark.kent@example.com",
+            base_url="https://example.com/search/",
+        )
+        request.send()
+        self.assertEqual(
+            session.post.call_args.args, ("https://example.com/search/v5/?",)
+        )
+
+
+class TimeoutTests(TestCase):
+    def setUp(self):
+        self.session = Mock()
+        self.session.post.return_value = Mock(
+            status_code=200, content=b'{"@http_status_code": 200}', headers={}
+        )
+        SearchAPIRequest.set_session(self.session)
+        self.addCleanup(SearchAPIRequest.set_session, None)
+
+    def send(self):
+        SearchAPIRequest(api_key="key", email="clark.kent@example.com").send()
+        return self.session.post.call_args.kwargs["timeout"]
+
+    def test_default_timeout(self):
+        self.assertEqual(self.send(), SearchAPIRequest.DEFAULT_TIMEOUT)
+
+    def test_custom_timeout(self):
+        with patch.object(SearchAPIRequest, "default_timeout", 5):
+            self.assertEqual(self.send(), 5)
+
+
+class QueryMemoTests(TestCase):
+    def test_changing_a_param_resets_the_query(self):
+        request = SearchAPIRequest(api_key="key", email="clark.kent@example.com")
+        self.assertNotIn("live_feeds", request.get_search_query())
+        request.live_feeds = False
+        self.assertEqual(request.get_search_query()["live_feeds"], False)
+        self.assertIn("live_feeds=False", request.url)
+        request.api_version = 4
+        self.assertIn("/v4/?", request.url)
+
+
+class RetryTests(TestCase):
+    def test_searches_that_may_have_run_are_not_resent(self):
+        retry = _create_session(3).get_adapter("https://api.pipl.com").max_retries
+        self.assertEqual(retry.connect, 3)
+        self.assertIs(retry.read, False)
+        self.assertEqual(tuple(retry.status_forcelist), (503,))
+
+
+class SessionTests(TestCase):
+    def setUp(self):
+        self.addCleanup(SearchAPIRequest.set_session, None)
+
+    def test_created_session_is_closed_when_replaced(self):
+        SearchAPIRequest.set_session(None)
+        session = SearchAPIRequest._get_session()
+        with patch.object(session, "close") as close:
+            SearchAPIRequest.set_session(None)
+        close.assert_called_once_with()
+        self.assertIsNot(SearchAPIRequest._get_session(), session)
+
+    def test_given_session_is_not_closed(self):
+        session = Mock()
+        SearchAPIRequest.set_session(session)
+        SearchAPIRequest.set_session(None)
+        session.close.assert_not_called()
+
+
+class AsyncWorkersTests(TestCase):
+    def setUp(self):
+        patcher = patch.object(
+            SearchAPIRequest,
+            "send",
+            autospec=True,
+            return_value=SearchAPIResponse(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(
+            SearchAPIRequest.set_async_workers, SearchAPIRequest.DEFAULT_ASYNC_WORKERS
+        )
+
+    def test_workers_are_not_shut_down_while_a_request_is_submitted(self):
+        submitting = threading.Event()
+        proceed = threading.Event()
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                submitting.set()
+                proceed.wait(5)
+                return super().submit(*args, **kwargs)
+
+        request = SearchAPIRequest(api_key="key", email="clark.kent@example.com")
+        futures = []
+        with patch("piplapis.search.ThreadPoolExecutor", Executor):
+            SearchAPIRequest.set_async_workers(2)
+            sender = threading.Thread(
+                target=lambda: futures.append(
+                    request.send_async(lambda response=None, error=None: None)
+                )
+            )
+            sender.start()
+            self.assertTrue(submitting.wait(5))
+            # Replace the workers while the request is being submitted
+            replacer = threading.Thread(
+                target=SearchAPIRequest.set_async_workers, args=(2,)
+            )
+            replacer.start()
+            replacer.join(0.2)
+            proceed.set()
+            sender.join(5)
+            replacer.join(5)
+        self.assertEqual(len(futures), 1)
+        self.assertIsInstance(futures[0].result(5), SearchAPIResponse)
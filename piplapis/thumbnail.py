@@ -4,10 +4,7 @@ Please use Image.get_thumbnail_url instead, as it uses the newer, complementary
 """
 import logging
 
-try:
-    from urllib.parse import urlencode
-except ImportError:
-    from urllib import urlencode
+from urllib.parse import urlencode
 
 from piplapis.data import Image
 from piplapis.data.utils import to_utf8